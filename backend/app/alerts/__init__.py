@@ -1,3 +1,4 @@
 from .engine import AlertEngine
+from .cooldown import CooldownStore, InMemoryCooldownStore, RedisCooldownStore
 
-__all__ = ["AlertEngine"]
+__all__ = ["AlertEngine", "CooldownStore", "InMemoryCooldownStore", "RedisCooldownStore"]
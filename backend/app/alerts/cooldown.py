@@ -0,0 +1,94 @@
+import logging
+import time
+from typing import Callable, Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+# Cooldown checks run under the alert engine lock, on the event loop in live
+# mode, so a stalled Redis must fail fast and fall back to local cooldowns
+REDIS_TIMEOUT_SECONDS = 0.5
+
+
+class CooldownStore(Protocol):
+    """Tracks per-alert-type cooldowns."""
+
+    def try_acquire(self, alert_type: str, period: float) -> bool:
+        """Start a cooldown for alert_type unless one is already running.
+
+        Returns True if the caller may fire the alert.
+        """
+        ...
+
+    def clear(self) -> None:
+        """Drop all cooldowns."""
+        ...
+
+
+class InMemoryCooldownStore:
+    """Process-local cooldowns keyed by alert type."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._cooldowns: dict[str, float] = {}  # alert_type -> clock() last_triggered
+
+    def try_acquire(self, alert_type: str, period: float) -> bool:
+        now = self._clock()
+        if now - self._cooldowns.get(alert_type, float("-inf")) < period:
+            return False
+        self._cooldowns[alert_type] = now
+        return True
+
+    def clear(self) -> None:
+        self._cooldowns.clear()
+
+
+class RedisCooldownStore:
+    """Cooldowns shared across workers and restarts via Redis TTL keys."""
+
+    KEY_PREFIX = "alert:cooldown:"
+
+    def __init__(self, client):
+        self._client = client
+        # Used while Redis is unreachable so alerts keep some debouncing
+        self._fallback = InMemoryCooldownStore()
+
+    def try_acquire(self, alert_type: str, period: float) -> bool:
+        try:
+            # NX makes the check-and-set atomic, so exactly one worker wins
+            return bool(
+                self._client.set(
+                    f"{self.KEY_PREFIX}{alert_type}", 1, nx=True, ex=max(1, int(period))
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Redis cooldown check failed, using local cooldowns: {e}")
+            return self._fallback.try_acquire(alert_type, period)
+
+    def clear(self) -> None:
+        self._fallback.clear()
+        try:
+            keys = list(self._client.scan_iter(match=f"{self.KEY_PREFIX}*"))
+            if keys:
+                self._client.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Failed to clear Redis cooldowns: {e}")
+
+
+def create_cooldown_store(redis_url: Optional[str]) -> CooldownStore:
+    """Create a Redis-backed store when configured, else an in-memory one."""
+    if not redis_url:
+        return InMemoryCooldownStore()
+
+    try:
+        import redis
+
+        client = redis.Redis.from_url(
+            redis_url,
+            socket_timeout=REDIS_TIMEOUT_SECONDS,
+            socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+        )
+        logger.info("Using Redis for alert cooldowns")
+        return RedisCooldownStore(client)
+    except ImportError:
+        logger.warning("redis package not installed - using in-memory alert cooldowns")
+        return InMemoryCooldownStore()
@@ -1,95 +1,190 @@
+import itertools
 import logging
 import uuid
 import threading
-from collections import deque
-from datetime import datetime, timedelta, timezone
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Callable, Optional
 
-from ..config import settings
+import orjson
+
+from ..config import Settings, settings
 from ..models import Alert, AlertSeverity, AlertStatus, SystemMetrics, Room
+from ..serialization import to_json_bytes
+from .cooldown import CooldownStore, create_cooldown_store
 
 logger = logging.getLogger(__name__)
 
+MetricsPredicate = Callable[[SystemMetrics], bool]
+
 
 class AlertEngine:
     """Detects and manages alerts based on metric thresholds."""
 
-    def __init__(self):
-        self._active_alerts: dict[str, Alert] = {}  # alert_id -> Alert
-        self._resolved_alerts: deque[Alert] = deque(maxlen=100)  # Keep last 100 resolved
-        self._alert_cooldowns: dict[str, datetime] = {}  # alert_type -> last_triggered
-        self._cooldown_period = timedelta(minutes=5)
+    def __init__(self, cooldown_store: Optional[CooldownStore] = None):
+        # Active alerts are published as an immutable snapshot that is rebuilt
+        # on mutation, so readers iterate it without copying or locking
+        self._active_list: tuple[Alert, ...] = ()
+        self._active_index: dict[str, int] = {}  # alert_id -> position in _active_list
+        self._by_type: dict[str, str] = {}  # alert_type -> active alert_id
+        # Keep the last 100 resolved alerts in preallocated slots; readers get a
+        # cached tuple that is only rebuilt after a write
+        self._resolved_ring: list[Optional[Alert]] = [None] * 100
+        self._ring_head = 0  # next slot to write
+        self._resolved_snapshot: Optional[tuple[Alert, ...]] = ()
+        self._alert_states: dict[str, bool] = {}  # alert_type -> raised
+        self._cooldowns = cooldown_store or create_cooldown_store(settings.redis_url)
+        self._cooldown_period = 300.0  # seconds
+        # Alert ids are a per-process prefix plus a counter: unique across
+        # restarts without a urandom read or UUID formatting per alert
+        self._id_prefix = uuid.uuid4().hex[:8]
+        self._id_counter = itertools.count(1)
         self._lock = threading.RLock()
 
+        # Thresholds are fixed after startup, so bind them once here
+        self._bands = self._compile_bands(settings)
+        self._room_duration_warning_minutes = settings.alert_room_duration_warning_minutes
+
+    @staticmethod
+    def _compile_bands(config: Settings) -> dict[str, tuple[MetricsPredicate, MetricsPredicate]]:
+        """Build the hysteresis predicates for each system alert type.
+
+        Returns alert_type -> (raise predicate, clear predicate). The clear
+        side sits well inside the raise side so a metric hovering near its
+        limit cannot flap. Thresholds are captured as closure constants, so
+        evaluating a predicate never touches the settings object.
+        """
+        disconnect_high = config.alert_disconnect_rate_threshold
+        disconnect_low = disconnect_high * 0.5
+        participants_high = config.alert_high_participant_threshold
+        participants_low = participants_high * 0.8
+        duration_high = config.alert_room_duration_warning_minutes * 60
+        duration_low = duration_high * 0.8
+
+        return {
+            "high_disconnect_rate": (
+                lambda m: (
+                    m.total_participants > 0
+                    and m.disconnect_rate / (m.total_participants or 1) > disconnect_high
+                ),
+                lambda m: (
+                    m.total_participants == 0
+                    or m.disconnect_rate / (m.total_participants or 1) <= disconnect_low
+                ),
+            ),
+            "high_participant_count": (
+                lambda m: m.total_participants > participants_high,
+                lambda m: m.total_participants <= participants_low,
+            ),
+            "low_connection_quality": (
+                lambda m: m.avg_connection_quality < 0.5 and m.total_participants > 0,
+                lambda m: m.avg_connection_quality >= 0.7,
+            ),
+            "long_room_duration": (
+                lambda m: m.avg_room_duration_seconds > duration_high,
+                lambda m: m.avg_room_duration_seconds <= duration_low,
+            ),
+        }
+
+    def next_alert_id(self) -> str:
+        """Generate a new alert id."""
+        return f"{self._id_prefix}-{next(self._id_counter)}"
+
+    def _set_active(self, alerts: tuple[Alert, ...]) -> None:
+        """Publish a new active alert snapshot and rebuild its index."""
+        self._active_list = alerts
+        self._active_index = {alert.id: i for i, alert in enumerate(alerts)}
+
+    def _band_raised(self, alert_type: str, metrics: SystemMetrics) -> bool:
+        """Advance the hysteresis state for an alert type.
+
+        Returns True while the band is cleared and the metric breaches the
+        raise threshold. The band only moves to raised once an alert is
+        actually created, so a breach held back by the cooldown is retried.
+        """
+        raise_check, clear_check = self._bands[alert_type]
+        if self._alert_states.get(alert_type, False):
+            if clear_check(metrics):
+                self._alert_states[alert_type] = False
+            return False
+
+        return raise_check(metrics)
+
     def check_metrics(self, metrics: SystemMetrics) -> list[Alert]:
         """Check metrics against thresholds and generate alerts."""
         with self._lock:
             new_alerts = []
 
             # Check disconnect rate
-            if metrics.total_participants > 0:
-                disconnect_ratio = metrics.disconnect_rate / max(1, metrics.total_participants)
-                if disconnect_ratio > settings.alert_disconnect_rate_threshold:
-                    alert = self._create_alert_if_not_cooldown(
-                        alert_type="high_disconnect_rate",
-                        severity=AlertSeverity.CRITICAL,
-                        title="High Disconnect Rate",
-                        description=f"Disconnect rate is {metrics.disconnect_rate:.1f}/min ({disconnect_ratio:.1%} of participants)",
-                    )
-                    if alert:
-                        new_alerts.append(alert)
+            if self._band_raised("high_disconnect_rate", metrics):
+                disconnect_ratio = metrics.disconnect_rate / (metrics.total_participants or 1)
+                alert = self._create_alert_if_not_cooldown(
+                    alert_type="high_disconnect_rate",
+                    severity=AlertSeverity.CRITICAL,
+                    title="High Disconnect Rate",
+                    description=f"Disconnect rate is {metrics.disconnect_rate:.1f}/min ({disconnect_ratio:.1%} of participants)",
+                    now=metrics.timestamp,
+                )
+                if alert:
+                    new_alerts.append(alert)
 
             # Check high participant count
-            if metrics.total_participants > settings.alert_high_participant_threshold:
+            if self._band_raised("high_participant_count", metrics):
                 alert = self._create_alert_if_not_cooldown(
                     alert_type="high_participant_count",
                     severity=AlertSeverity.WARNING,
                     title="High Participant Count",
                     description=f"System has {metrics.total_participants} active participants",
+                    now=metrics.timestamp,
                 )
                 if alert:
                     new_alerts.append(alert)
 
             # Check connection quality
-            if metrics.avg_connection_quality < 0.5 and metrics.total_participants > 0:
+            if self._band_raised("low_connection_quality", metrics):
                 alert = self._create_alert_if_not_cooldown(
                     alert_type="low_connection_quality",
                     severity=AlertSeverity.WARNING,
                     title="Low Average Connection Quality",
                     description=f"Average connection quality is {metrics.avg_connection_quality:.0%}",
+                    now=metrics.timestamp,
                 )
                 if alert:
                     new_alerts.append(alert)
 
             # Check for stale rooms (very long duration)
-            warning_duration = settings.alert_room_duration_warning_minutes * 60
-            if metrics.avg_room_duration_seconds > warning_duration:
+            if self._band_raised("long_room_duration", metrics):
                 alert = self._create_alert_if_not_cooldown(
                     alert_type="long_room_duration",
                     severity=AlertSeverity.INFO,
                     title="Long Running Rooms Detected",
                     description=f"Average room duration is {metrics.avg_room_duration_seconds / 60:.0f} minutes",
+                    now=metrics.timestamp,
                 )
                 if alert:
                     new_alerts.append(alert)
 
             return new_alerts
 
-    def check_room(self, room: Room) -> list[Alert]:
-        """Check individual room for alerts."""
+    def check_room(self, room: Room, now: Optional[datetime] = None) -> list[Alert]:
+        """Check individual room for alerts.
+
+        Callers checking several rooms in one pass should supply ``now`` so the
+        rooms share a single timestamp.
+        """
         with self._lock:
             new_alerts = []
-            now = datetime.now(timezone.utc)
+            now = now or datetime.now(timezone.utc)
 
             # Check room duration
             room_duration_minutes = (now - room.created_at).total_seconds() / 60
-            if room_duration_minutes > settings.alert_room_duration_warning_minutes:
+            if room_duration_minutes > self._room_duration_warning_minutes:
                 alert = self._create_alert_if_not_cooldown(
                     alert_type=f"room_long_duration_{room.sid}",
                     severity=AlertSeverity.INFO,
                     title=f"Room Running for {room_duration_minutes:.0f}+ Minutes",
                     description=f"Room '{room.name}' has been active for {room_duration_minutes:.0f} minutes",
                     room_name=room.name,
+                    now=now,
                 )
                 if alert:
                     new_alerts.append(alert)
@@ -103,43 +198,60 @@ class AlertEngine:
         title: str,
         description: str,
         room_name: Optional[str] = None,
+        now: Optional[datetime] = None,
     ) -> Optional[Alert]:
         """Create an alert if not in cooldown period."""
         with self._lock:
-            now = datetime.now(timezone.utc)
-
-            # Check cooldown
-            if alert_type in self._alert_cooldowns:
-                last_triggered = self._alert_cooldowns[alert_type]
-                if now - last_triggered < self._cooldown_period:
-                    return None
+            # Check cooldown (starts a new one if none is running)
+            if not self._cooldowns.try_acquire(alert_type, self._cooldown_period):
+                return None
 
             # Create alert
             alert = Alert(
-                id=str(uuid.uuid4()),
+                id=self.next_alert_id(),
+                alert_type=alert_type,
                 severity=severity,
                 status=AlertStatus.ACTIVE,
                 title=title,
                 description=description,
                 room_name=room_name,
-                created_at=now,
+                created_at=now or datetime.now(timezone.utc),
             )
 
-            self._active_alerts[alert.id] = alert
-            self._alert_cooldowns[alert_type] = now
+            self._set_active(self._active_list + (alert,))
+            self._by_type[alert_type] = alert.id
+            if alert_type in self._bands:
+                self._alert_states[alert_type] = True
             logger.info(f"Alert created: {title}")
 
             return alert
 
+    def add_alert(self, alert: Alert) -> None:
+        """Register an externally created alert as active."""
+        with self._lock:
+            self._set_active(self._active_list + (alert,))
+
     def resolve_alert(self, alert_id: str) -> Optional[Alert]:
         """Manually resolve an alert."""
         with self._lock:
-            alert = self._active_alerts.pop(alert_id, None)
-            if alert:
-                alert.status = AlertStatus.RESOLVED
-                alert.resolved_at = datetime.now(timezone.utc)
-                self._resolved_alerts.append(alert)
-                logger.info(f"Alert resolved: {alert.title}")
+            idx = self._active_index.get(alert_id)
+            if idx is None:
+                return None
+
+            alert = self._active_list[idx]
+            self._set_active(self._active_list[:idx] + self._active_list[idx + 1:])
+            if self._by_type.get(alert.alert_type) == alert_id:
+                del self._by_type[alert.alert_type]
+                # Re-arm the band so a breach that persists alerts again
+                # once the cooldown expires
+                self._alert_states.pop(alert.alert_type, None)
+            alert.status = AlertStatus.RESOLVED
+            alert.resolved_at = datetime.now(timezone.utc)
+            alert._json_cache = None
+            self._resolved_ring[self._ring_head] = alert
+            self._ring_head = (self._ring_head + 1) % len(self._resolved_ring)
+            self._resolved_snapshot = None
+            logger.info(f"Alert resolved: {alert.title}")
             return alert
 
     def auto_resolve_alerts(self, metrics: SystemMetrics) -> list[Alert]:
@@ -147,53 +259,48 @@ class AlertEngine:
         with self._lock:
             resolved = []
 
-            for alert_id, alert in list(self._active_alerts.items()):
-                should_resolve = False
-
-                # Check if conditions have improved
-                if "disconnect" in alert.title.lower():
-                    if metrics.total_participants == 0 or (
-                        metrics.disconnect_rate / max(1, metrics.total_participants)
-                        <= settings.alert_disconnect_rate_threshold * 0.5
-                    ):
-                        should_resolve = True
-
-                elif "participant count" in alert.title.lower():
-                    if metrics.total_participants <= settings.alert_high_participant_threshold * 0.8:
-                        should_resolve = True
-
-                elif "connection quality" in alert.title.lower():
-                    if metrics.avg_connection_quality >= 0.7:
-                        should_resolve = True
-
-                if should_resolve:
+            # check_metrics has already moved each band to its cleared state
+            # once the metric dropped below the clear threshold. Walking the
+            # fixed set of band types keeps this independent of alert volume.
+            for alert_type in self._bands:
+                alert_id = self._by_type.get(alert_type)
+                if alert_id and not self._alert_states.get(alert_type, False):
                     resolved_alert = self.resolve_alert(alert_id)
                     if resolved_alert:
                         resolved.append(resolved_alert)
 
             return resolved
 
-    def get_active_alerts(self) -> list[Alert]:
-        """Get all active alerts."""
-        with self._lock:
-            return list(self._active_alerts.values())
+    def get_active_alerts(self) -> tuple[Alert, ...]:
+        """Get all active alerts as an immutable snapshot."""
+        return self._active_list
 
-    def get_resolved_alerts(self) -> list[Alert]:
-        """Get recently resolved alerts."""
+    def get_resolved_alerts(self) -> tuple[Alert, ...]:
+        """Get recently resolved alerts, oldest first."""
         with self._lock:
-            return list(self._resolved_alerts)
+            if self._resolved_snapshot is None:
+                head = self._ring_head
+                ring = self._resolved_ring
+                self._resolved_snapshot = tuple(
+                    alert for alert in ring[head:] + ring[:head] if alert is not None
+                )
+            return self._resolved_snapshot
 
-    def get_all_alerts(self) -> dict:
-        """Get all alerts for API response."""
+    def get_all_alerts(self) -> bytes:
+        """Get all alerts for API response as serialized JSON."""
         with self._lock:
-            return {
-                "active": [a.model_dump(mode="json") for a in self.get_active_alerts()],
-                "resolved": [a.model_dump(mode="json") for a in self.get_resolved_alerts()],
-            }
+            return orjson.dumps({
+                "active": [orjson.Fragment(to_json_bytes(a)) for a in self.get_active_alerts()],
+                "resolved": [orjson.Fragment(to_json_bytes(a)) for a in self.get_resolved_alerts()],
+            })
 
     def clear(self) -> None:
         """Clear all data (useful for testing)."""
         with self._lock:
-            self._active_alerts.clear()
-            self._resolved_alerts.clear()
-            self._alert_cooldowns.clear()
+            self._set_active(())
+            self._by_type.clear()
+            self._resolved_ring = [None] * len(self._resolved_ring)
+            self._ring_head = 0
+            self._resolved_snapshot = ()
+            self._cooldowns.clear()
+            self._alert_states.clear()
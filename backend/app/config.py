@@ -10,20 +10,26 @@ class Settings(BaseSettings):
     livekit_api_secret: str = ""
 
     # Application Settings
+    env: str = "development"  # "production" disables auto-reload in run.py
     mock_mode: bool = True  # Enable mock data generation by default
     cors_origins: list[str] = ["http://localhost:5173", "http://localhost:3000"]
 
     # Metrics Settings
     metrics_retention_seconds: int = 300  # 5 minutes
     metrics_update_interval: float = 1.0  # 1 second
+    metrics_idle_snapshot_interval: float = 10.0  # Snapshot cadence with no listeners or changes
 
     # Alert Thresholds
     alert_disconnect_rate_threshold: float = 0.1  # 10% disconnect rate
     alert_high_participant_threshold: int = 100
     alert_room_duration_warning_minutes: int = 120  # 2 hours
 
+    # Optional Redis URL for alert cooldowns shared across workers/restarts
+    redis_url: Optional[str] = None
+
     # WebSocket Settings
     websocket_heartbeat_interval: float = 30.0
+    ws_send_timeout: float = 5.0  # Seconds before a stalled client is dropped
 
     # SDK Polling Interval (fallback for webhooks)
     sdk_poll_interval_seconds: int = 30
@@ -8,6 +8,17 @@ from ..models import Room, Participant, ConnectionQuality
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent LiveKit API requests during a room sync
+MAX_CONCURRENT_REQUESTS = 16
+
+# LiveKit protobuf ConnectionQuality values (POOR=0, GOOD=1, EXCELLENT=2, LOST=3)
+_QUALITY_MAP: dict[int, ConnectionQuality] = {
+    0: ConnectionQuality.POOR,
+    1: ConnectionQuality.GOOD,
+    2: ConnectionQuality.EXCELLENT,
+    3: ConnectionQuality.POOR,  # LOST
+}
+
 
 class LiveKitClient:
     """Wrapper for LiveKit Server SDK to poll room/participant data."""
@@ -101,14 +112,7 @@ class LiveKitClient:
         """Map LiveKit connection quality enum to our model."""
         if quality is None:
             return ConnectionQuality.UNKNOWN
-        quality_str = str(quality).lower()
-        if "excellent" in quality_str:
-            return ConnectionQuality.EXCELLENT
-        elif "good" in quality_str:
-            return ConnectionQuality.GOOD
-        elif "poor" in quality_str:
-            return ConnectionQuality.POOR
-        return ConnectionQuality.UNKNOWN
+        return _QUALITY_MAP.get(int(quality), ConnectionQuality.UNKNOWN)
 
     async def sync_rooms(self, metrics_store) -> int:
         """Sync rooms from LiveKit server to metrics store.
@@ -119,11 +123,25 @@ class LiveKitClient:
             return 0
 
         rooms = await self.list_rooms()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def fetch_participants(room: Room) -> list[Participant]:
+            async with semaphore:
+                return await self.list_participants(room.name)
+
+        # Fetch every room's participants concurrently rather than one RTT per room
+        results = await asyncio.gather(
+            *(fetch_participants(room) for room in rooms),
+            return_exceptions=True,
+        )
         synced = 0
 
-        for room in rooms:
-            participants = await self.list_participants(room.name)
-            room.participants = participants
+        for room, participants in zip(rooms, results):
+            if isinstance(participants, Exception):
+                logger.error(f"Failed to sync participants for room {room.name}: {participants}")
+                continue
+
+            room._participants = {p.sid: p for p in participants}
             room.participant_count = len(participants)
             metrics_store.add_room(room)
             synced += 1
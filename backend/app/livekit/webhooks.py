@@ -1,6 +1,7 @@
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Callable, Optional
 
 from ..models import Room, Participant, ConnectionQuality, WebhookEvent
 from ..metrics import MetricsStore
@@ -18,21 +19,11 @@ def process_webhook_event(
     event_type = event.event
     logger.info(f"Processing webhook event: {event_type}")
 
-    if event_type == "room_started":
-        return _handle_room_started(event, metrics_store)
-    elif event_type == "room_finished":
-        return _handle_room_finished(event, metrics_store)
-    elif event_type == "participant_joined":
-        return _handle_participant_joined(event, metrics_store)
-    elif event_type == "participant_left":
-        return _handle_participant_left(event, metrics_store)
-    elif event_type == "track_published":
-        return _handle_track_published(event, metrics_store)
-    elif event_type == "track_unpublished":
-        return _handle_track_unpublished(event, metrics_store)
-    else:
+    handler = _HANDLERS.get(event_type)
+    if handler is None:
         logger.debug(f"Unhandled webhook event type: {event_type}")
         return None
+    return handler(event, metrics_store)
 
 
 def _handle_room_started(
@@ -44,13 +35,14 @@ def _handle_room_started(
 
     room_data = event.room
     created_at = datetime.fromtimestamp(
-        event.created_at or room_data.get("creation_time", datetime.now(timezone.utc).timestamp()),
+        event.created_at or room_data.creation_time or time.time(),
         tz=timezone.utc
     )
 
-    room = Room(
-        sid=room_data.get("sid", ""),
-        name=room_data.get("name", ""),
+    # The event was validated on decode, so skip re-validating the same fields
+    room = Room.model_construct(
+        sid=room_data.sid,
+        name=room_data.name,
         created_at=created_at,
         participant_count=0,
         max_participants=0,
@@ -59,7 +51,7 @@ def _handle_room_started(
     metrics_store.add_room(room)
     logger.info(f"Room started: {room.name} ({room.sid})")
 
-    return {"type": "room_started", "room": room.model_dump(mode="json")}
+    return {"type": "room_started", "room": room}
 
 
 def _handle_room_finished(
@@ -69,12 +61,11 @@ def _handle_room_finished(
     if not event.room:
         return None
 
-    room_sid = event.room.get("sid", "")
-    room = metrics_store.remove_room(room_sid)
+    room = metrics_store.remove_room(event.room.sid)
 
     if room:
         logger.info(f"Room finished: {room.name} ({room.sid})")
-        return {"type": "room_finished", "room": room.model_dump(mode="json")}
+        return {"type": "room_finished", "room": room}
 
     return None
 
@@ -86,18 +77,18 @@ def _handle_participant_joined(
     if not event.room or not event.participant:
         return None
 
-    room_sid = event.room.get("sid", "")
+    room_sid = event.room.sid
     participant_data = event.participant
 
     joined_at = datetime.fromtimestamp(
-        participant_data.get("joined_at", datetime.now(timezone.utc).timestamp()),
+        participant_data.joined_at or time.time(),
         tz=timezone.utc
     )
 
     participant = Participant(
-        sid=participant_data.get("sid", ""),
-        identity=participant_data.get("identity", ""),
-        name=participant_data.get("name") or participant_data.get("identity", ""),
+        sid=participant_data.sid,
+        identity=participant_data.identity,
+        name=participant_data.name or participant_data.identity,
         joined_at=joined_at,
         connection_quality=ConnectionQuality.UNKNOWN,
         is_publisher=False,
@@ -106,12 +97,12 @@ def _handle_participant_joined(
 
     if metrics_store.add_participant(room_sid, participant):
         logger.info(
-            f"Participant joined: {participant.identity} in room {event.room.get('name', room_sid)}"
+            f"Participant joined: {participant.identity} in room {event.room.name or room_sid}"
         )
         return {
             "type": "participant_joined",
             "room_sid": room_sid,
-            "participant": participant.model_dump(mode="json"),
+            "participant": participant,
         }
 
     return None
@@ -124,18 +115,18 @@ def _handle_participant_left(
     if not event.room or not event.participant:
         return None
 
-    room_sid = event.room.get("sid", "")
-    participant_sid = event.participant.get("sid", "")
-    participant_identity = event.participant.get("identity", "")
+    room_sid = event.room.sid
+    participant_sid = event.participant.sid
+    participant_identity = event.participant.identity
 
     # Check if this was a disconnect (unexpected leave)
     # LiveKit provides a "state" field - if it's not "ACTIVE" it might be a disconnect
-    state = event.participant.get("state", "")
+    state = event.participant.state
     is_disconnect = state in ("DISCONNECTED", "disconnected")
 
     if metrics_store.remove_participant(room_sid, participant_sid, is_disconnect):
         logger.info(
-            f"Participant left: {participant_identity} from room {event.room.get('name', room_sid)} "
+            f"Participant left: {participant_identity} from room {event.room.name or room_sid} "
             f"(disconnect: {is_disconnect})"
         )
         return {
@@ -155,17 +146,15 @@ def _handle_track_published(
     if not event.room or not event.participant:
         return None
 
-    room_sid = event.room.get("sid", "")
-    room = metrics_store.get_room(room_sid)
+    room = metrics_store.get_room(event.room.sid)
     if not room:
         return None
 
-    participant_sid = event.participant.get("sid", "")
-    for participant in room.participants:
-        if participant.sid == participant_sid:
-            participant.is_publisher = True
-            participant.tracks_published += 1
-            break
+    participant = room._participants.get(event.participant.sid)
+    if participant:
+        participant.is_publisher = True
+        participant.tracks_published += 1
+        metrics_store.mark_room_changed(room)
 
     return None
 
@@ -177,17 +166,26 @@ def _handle_track_unpublished(
     if not event.room or not event.participant:
         return None
 
-    room_sid = event.room.get("sid", "")
-    room = metrics_store.get_room(room_sid)
+    room = metrics_store.get_room(event.room.sid)
     if not room:
         return None
 
-    participant_sid = event.participant.get("sid", "")
-    for participant in room.participants:
-        if participant.sid == participant_sid:
-            participant.tracks_published = max(0, participant.tracks_published - 1)
-            if participant.tracks_published == 0:
-                participant.is_publisher = False
-            break
+    participant = room._participants.get(event.participant.sid)
+    if participant:
+        participant.tracks_published = max(0, participant.tracks_published - 1)
+        if participant.tracks_published == 0:
+            participant.is_publisher = False
+        metrics_store.mark_room_changed(room)
 
     return None
+
+
+# event type -> handler, looked up once per webhook in process_webhook_event
+_HANDLERS: dict[str, Callable[[WebhookEvent, MetricsStore], Optional[dict]]] = {
+    "room_started": _handle_room_started,
+    "room_finished": _handle_room_finished,
+    "participant_joined": _handle_participant_joined,
+    "participant_left": _handle_participant_left,
+    "track_published": _handle_track_published,
+    "track_unpublished": _handle_track_unpublished,
+}
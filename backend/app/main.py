@@ -1,9 +1,10 @@
 import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
 from typing import Optional
 
-from fastapi import FastAPI, WebSocket, HTTPException, Request
+from fastapi import FastAPI, WebSocket, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config import settings
@@ -13,6 +14,7 @@ from .alerts import AlertEngine
 from .websocket import WebSocketHub
 from .livekit import LiveKitClient, process_webhook_event
 from .mock import MockDataGenerator
+from .serialization import to_json_bytes
 
 # Configure logging
 logging.basicConfig(
@@ -32,26 +34,37 @@ mock_generator: Optional[MockDataGenerator] = None
 background_tasks: list[asyncio.Task] = []
 
 
+def json_response(content: bytes) -> Response:
+    """Wrap pre-serialized JSON in a response."""
+    return Response(content=content, media_type="application/json")
+
+
 async def metrics_update_loop():
     """Background task to periodically update metrics."""
+    last_snapshot = 0.0
     while True:
         try:
+            # With no dashboards connected and nothing changed, only keep the
+            # history going at the slower idle cadence
+            idle = websocket_hub.client_count == 0 and not metrics_store.dirty
+            if idle and time.monotonic() - last_snapshot < settings.metrics_idle_snapshot_interval:
+                await asyncio.sleep(settings.metrics_update_interval)
+                continue
+
             # Record metrics snapshot
+            last_snapshot = time.monotonic()
             metrics = metrics_store.record_metrics_snapshot()
 
             # Check for alerts
             new_alerts = alert_engine.check_metrics(metrics)
             resolved_alerts = alert_engine.auto_resolve_alerts(metrics)
 
-            # Broadcast to WebSocket clients (if not in mock mode, mock generator handles this)
-            if not settings.mock_mode:
-                await websocket_hub.broadcast_metrics(metrics.model_dump(mode="json"))
-
-                for alert in new_alerts:
-                    await websocket_hub.broadcast_alert(alert.model_dump(mode="json"))
-
-                for alert in resolved_alerts:
-                    await websocket_hub.broadcast_alert(alert.model_dump(mode="json"))
+            # Broadcast to WebSocket clients (if not in mock mode, mock generator handles this).
+            # Idle ticks are skipped; the heartbeat keeps connections alive meanwhile.
+            changed = metrics_store.metrics_changed(metrics)
+            if not settings.mock_mode and (changed or new_alerts or resolved_alerts):
+                # One frame per tick carries the metrics and any alert changes
+                await websocket_hub.broadcast_tick(metrics, new_alerts, resolved_alerts)
 
             await asyncio.sleep(settings.metrics_update_interval)
         except asyncio.CancelledError:
@@ -80,6 +93,12 @@ async def sdk_poll_loop():
             await asyncio.sleep(settings.sdk_poll_interval_seconds)
 
 
+def touch_snapshot() -> None:
+    """Tell the mock generator that someone is reading metrics over HTTP."""
+    if mock_generator:
+        mock_generator.touch_snapshot()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
@@ -171,43 +190,46 @@ async def health_check():
 @app.get("/api/metrics/current")
 async def get_current_metrics():
     """Get current system metrics snapshot."""
+    touch_snapshot()
     metrics = metrics_store.compute_current_metrics()
-    return metrics.model_dump(mode="json")
+    return json_response(to_json_bytes(metrics))
 
 
 @app.get("/api/metrics/history")
 async def get_metrics_history():
     """Get metrics history (time-series data)."""
-    history = metrics_store.get_history()
-    return [m.model_dump(mode="json") for m in history]
+    touch_snapshot()
+    return json_response(metrics_store.get_history_json())
 
 
 @app.get("/api/metrics/snapshot")
 async def get_full_snapshot() -> MetricsSnapshot:
     """Get complete metrics snapshot including rooms."""
+    touch_snapshot()
     return metrics_store.get_snapshot()
 
 
 @app.get("/api/rooms")
 async def get_rooms():
     """Get list of active rooms."""
-    rooms = metrics_store.get_all_rooms()
-    return [r.model_dump(mode="json") for r in rooms]
+    touch_snapshot()
+    return json_response(metrics_store.get_rooms_json())
 
 
 @app.get("/api/rooms/{room_name}")
 async def get_room(room_name: str):
     """Get details of a specific room."""
+    touch_snapshot()
     room = metrics_store.get_room_by_name(room_name)
     if not room:
         raise HTTPException(status_code=404, detail="Room not found")
-    return room.model_dump(mode="json")
+    return json_response(metrics_store.get_room_json(room))
 
 
 @app.get("/api/alerts")
 async def get_alerts():
     """Get active and recent alerts."""
-    return alert_engine.get_all_alerts()
+    return json_response(alert_engine.get_all_alerts())
 
 
 @app.post("/api/alerts/{alert_id}/resolve")
@@ -218,17 +240,18 @@ async def resolve_alert(alert_id: str):
         raise HTTPException(status_code=404, detail="Alert not found")
 
     # Broadcast resolution
-    await websocket_hub.broadcast_alert(alert.model_dump(mode="json"))
+    data = to_json_bytes(alert)
+    await websocket_hub.broadcast_alert(data)
 
-    return alert.model_dump(mode="json")
+    return json_response(data)
 
 
 @app.post("/api/livekit/webhook")
 async def receive_webhook(request: Request):
     """Receive LiveKit webhook events."""
     try:
-        body = await request.json()
-        event = WebhookEvent(**body)
+        # Parse and validate the payload in a single pass
+        event = WebhookEvent.model_validate_json(await request.body())
 
         # Process the webhook event
         result = process_webhook_event(event, metrics_store)
@@ -1,9 +1,12 @@
 import threading
-from collections import deque
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import datetime, timezone
 from typing import Optional
 
+import orjson
+
 from ..config import settings
+from ..serialization import to_json_bytes, to_json_list
 from ..models import (
     Room,
     Participant,
@@ -12,29 +15,120 @@ from ..models import (
     ConnectionQuality,
 )
 
+# Number of independently locked room shards in MetricsStore
+ROOM_SHARDS = 16
+
+
+# Connection quality on a 0-1 scale; UNKNOWN is left out of the average
+_QUALITY_SCORES: dict[ConnectionQuality, float] = {
+    ConnectionQuality.EXCELLENT: 1.0,
+    ConnectionQuality.GOOD: 0.75,
+    ConnectionQuality.POOR: 0.25,
+}
+
 
 class RingBuffer:
-    """Thread-safe ring buffer for time-series metrics."""
+    """Thread-safe ring buffer for time-series metrics.
+
+    Appends take a short lock. Readers copy the slots without it and use the
+    append counters to drop any slot that was overwritten while copying.
+    """
 
     def __init__(self, max_size: int):
-        self._buffer: deque[SystemMetrics] = deque(maxlen=max_size)
-        self._lock = threading.RLock()
+        self._slots: list[Optional[SystemMetrics]] = [None] * max_size
+        self._max_size = max_size
+        # Appends started / finished; the next write goes to slot _count % max_size
+        self._started = 0
+        self._count = 0
+        self._lock = threading.Lock()
 
     def append(self, item: SystemMetrics) -> None:
         with self._lock:
-            self._buffer.append(item)
+            self._started += 1
+            self._slots[self._count % self._max_size] = item
+            self._count += 1
+
+    @property
+    def version(self) -> int:
+        """Total number of appends, usable as a cache key for the contents."""
+        return self._count
 
     def get_all(self) -> list[SystemMetrics]:
-        with self._lock:
-            return list(self._buffer)
+        count = self._count
+        size = min(count, self._max_size)
+        head = count % self._max_size if count >= self._max_size else 0
+        items = self._slots[head:size] + self._slots[:head]
+
+        # Writes fill free slots first, then overwrite the oldest items we copied
+        overwritten = self._started - count - (self._max_size - size)
+        return items[overwritten:] if overwritten > 0 else items
 
     def get_latest(self) -> Optional[SystemMetrics]:
-        with self._lock:
-            return self._buffer[-1] if self._buffer else None
+        while True:
+            count = self._count
+            if not count:
+                return None
+            item = self._slots[(count - 1) % self._max_size]
+            # The slot is only reused once max_size further appends have started
+            if self._started - count < self._max_size:
+                return item
 
     def __len__(self) -> int:
+        return min(self._count, self._max_size)
+
+
+class RateWindow:
+    """Thread-safe event counter over a sliding window of one-second buckets."""
+
+    def __init__(self, window_seconds: int = 60):
+        self._buckets = [0] * window_seconds
+        self._total = 0  # sum of all buckets
+        self._last_second = int(time.monotonic())
+        self._lock = threading.Lock()
+
+    def _advance(self, second: int) -> None:
+        # Expire the buckets for the seconds that passed since the last update
+        elapsed = second - self._last_second
+        if elapsed <= 0:
+            return
+        size = len(self._buckets)
+        if elapsed >= size:
+            # Idle for a whole window: everything has expired
+            self._buckets = [0] * size
+            self._total = 0
+        else:
+            for s in range(self._last_second + 1, second + 1):
+                idx = s % size
+                self._total -= self._buckets[idx]
+                self._buckets[idx] = 0
+        self._last_second = second
+
+    def record(self) -> None:
+        second = int(time.monotonic())
         with self._lock:
-            return len(self._buffer)
+            self._advance(second)
+            self._buckets[second % len(self._buckets)] += 1
+            self._total += 1
+
+    def count(self) -> int:
+        with self._lock:
+            self._advance(int(time.monotonic()))
+            return self._total
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets = [0] * len(self._buckets)
+            self._total = 0
+
+
+class _RoomShard:
+    """A slice of the room map guarded by its own lock."""
+
+    __slots__ = ("rooms", "lock")
+
+    def __init__(self):
+        self.rooms: dict[str, Room] = {}  # room_sid -> Room
+        self.lock = threading.Lock()
 
 
 class MetricsStore:
@@ -46,163 +140,286 @@ class MetricsStore:
             settings.metrics_retention_seconds / settings.metrics_update_interval
         )
         self._metrics_history = RingBuffer(buffer_size)
-        self._rooms: dict[str, Room] = {}  # room_sid -> Room
-        self._lock = threading.RLock()
 
-        # Event counters for rate calculations
-        self._join_events: deque[datetime] = deque()
-        self._leave_events: deque[datetime] = deque()
-        self._disconnect_events: deque[datetime] = deque()
-        self._rate_window = timedelta(minutes=1)
+        # Rooms are spread over shards by sid so room/participant writes only
+        # contend with writes to the same shard
+        self._shards = [_RoomShard() for _ in range(ROOM_SHARDS)]
+
+        # Guards the name index, versions and cached payloads below. Lock
+        # order is shard lock first, then this one; never the reverse.
+        self._lock = threading.Lock()
+        # room_name -> sids of the live rooms with that name; names may repeat
+        self._rooms_by_name: dict[str, set[str]] = {}
+
+        # Encoded API payloads, keyed by the rooms version and the history's
+        # append count they were built at
+        self._rooms_version = 0
+        self._rooms_json: Optional[tuple[int, bytes]] = None
+        self._history_json: Optional[tuple[int, bytes]] = None
+
+        # Set on any room/participant change, cleared when a snapshot is recorded
+        self._dirty = False
+
+        # Running aggregates, updated with every room/participant change so
+        # computing metrics does not walk every participant. Guarded by _lock.
+        self._room_count = 0
+        self._total_participants = 0
+        self._quality_sum = 0.0
+        self._quality_count = 0  # participants with a known quality
+        self._created_epoch_sum = 0.0
+
+        # Event counters for per-minute rate calculations
+        self._joins = RateWindow()
+        self._leaves = RateWindow()
+        self._disconnects = RateWindow()
+
+        # Hash of the last metrics reported by metrics_changed()
+        self._last_metrics_hash: Optional[int] = None
+
+    def _shard(self, room_sid: str) -> _RoomShard:
+        return self._shards[hash(room_sid) % len(self._shards)]
 
     def add_room(self, room: Room) -> None:
-        with self._lock:
-            self._rooms[room.sid] = room
+        shard = self._shard(room.sid)
+        with shard.lock:
+            existing = shard.rooms.get(room.sid)
+            shard.rooms[room.sid] = room
+            with self._lock:
+                if existing:
+                    self._unindex(existing)
+                    self._add_room_totals(existing, -1)
+                self._rooms_by_name.setdefault(room.name, set()).add(room.sid)
+                self._add_room_totals(room, 1)
+                self._rooms_changed()
 
     def remove_room(self, room_sid: str) -> Optional[Room]:
-        with self._lock:
-            return self._rooms.pop(room_sid, None)
+        shard = self._shard(room_sid)
+        with shard.lock:
+            room = shard.rooms.pop(room_sid, None)
+            if room:
+                with self._lock:
+                    self._unindex(room)
+                    self._add_room_totals(room, -1)
+                    self._rooms_changed()
+            return room
+
+    def _unindex(self, room: Room) -> None:
+        sids = self._rooms_by_name.get(room.name)
+        if sids is not None:
+            sids.discard(room.sid)
+            if not sids:
+                del self._rooms_by_name[room.name]
+
+    def _add_quality(self, quality: ConnectionQuality, sign: int) -> None:
+        score = _QUALITY_SCORES.get(quality)
+        if score is not None:
+            self._quality_sum += sign * score
+            self._quality_count += sign
+
+    def _add_room_totals(self, room: Room, sign: int) -> None:
+        """Add (sign=1) or subtract (sign=-1) a room's share of the aggregates."""
+        self._room_count += sign
+        self._total_participants += sign * room.participant_count
+        self._created_epoch_sum += sign * room._created_epoch
+        for participant in room._participants.values():
+            self._add_quality(participant.connection_quality, sign)
 
     def get_room(self, room_sid: str) -> Optional[Room]:
-        with self._lock:
-            return self._rooms.get(room_sid)
+        shard = self._shard(room_sid)
+        with shard.lock:
+            return shard.rooms.get(room_sid)
 
     def get_room_by_name(self, room_name: str) -> Optional[Room]:
         with self._lock:
-            for room in self._rooms.values():
-                if room.name == room_name:
-                    return room
-            return None
+            sids = self._rooms_by_name.get(room_name)
+            room_sid = next(iter(sids)) if sids else None
+        return self.get_room(room_sid) if room_sid else None
 
     def get_all_rooms(self) -> list[Room]:
+        rooms = []
+        for shard in self._shards:
+            with shard.lock:
+                rooms.extend(shard.rooms.values())
+        return rooms
+
+    def _rooms_changed(self) -> None:
+        self._rooms_version += 1
+        self._dirty = True
+
+    @property
+    def dirty(self) -> bool:
+        """Whether rooms have changed since the last recorded snapshot."""
+        return self._dirty
+
+    def mark_room_changed(self, room: Room) -> None:
+        """Invalidate cached payloads after a room or its participants mutate."""
         with self._lock:
-            return list(self._rooms.values())
+            room._json_cache = None
+            self._rooms_changed()
+
+    def get_room_json(self, room: Room) -> bytes:
+        """Get a room as JSON.
+
+        Encodes under the room's shard lock so a mutation from another thread
+        cannot reset the room's cache mid-encode and leave a stale payload.
+        """
+        with self._shard(room.sid).lock:
+            return to_json_bytes(room)
+
+    def get_rooms_json(self) -> bytes:
+        """Get all rooms as JSON, re-encoding only after a room changes."""
+        # Read the version before the rooms: a concurrent change then leaves the
+        # cache stamped with a stale version, which only forces a rebuild
+        version = self._rooms_version
+        cached = self._rooms_json
+        if cached is None or cached[0] != version:
+            fragments = []
+            for shard in self._shards:
+                with shard.lock:
+                    fragments.extend(
+                        orjson.Fragment(to_json_bytes(room)) for room in shard.rooms.values()
+                    )
+            cached = (version, orjson.dumps(fragments))
+            self._rooms_json = cached
+        return cached[1]
 
     def add_participant(self, room_sid: str, participant: Participant) -> bool:
-        with self._lock:
-            room = self._rooms.get(room_sid)
+        shard = self._shard(room_sid)
+        with shard.lock:
+            room = shard.rooms.get(room_sid)
             if not room:
                 return False
 
-            # Check if participant already exists
-            existing = next(
-                (p for p in room.participants if p.sid == participant.sid), None
-            )
-            if existing:
-                # Update existing participant
-                idx = room.participants.index(existing)
-                room.participants[idx] = participant
-            else:
-                room.participants.append(participant)
-                room.participant_count = len(room.participants)
+            # Upsert; only a new participant counts as a join
+            previous = room._participants.get(participant.sid)
+            room._participants[participant.sid] = participant
+            previous_count = room.participant_count
+            if previous is None:
+                room.participant_count = len(room._participants)
                 room.max_participants = max(
                     room.max_participants, room.participant_count
                 )
-                self._record_join()
-
+                self._joins.record()
+
+            with self._lock:
+                self._total_participants += room.participant_count - previous_count
+                if previous is not None:
+                    self._add_quality(previous.connection_quality, -1)
+                self._add_quality(participant.connection_quality, 1)
+                room._json_cache = None
+                self._rooms_changed()
             return True
 
     def remove_participant(
         self, room_sid: str, participant_sid: str, is_disconnect: bool = False
     ) -> bool:
-        with self._lock:
-            room = self._rooms.get(room_sid)
+        shard = self._shard(room_sid)
+        with shard.lock:
+            room = shard.rooms.get(room_sid)
             if not room:
                 return False
 
-            room.participants = [
-                p for p in room.participants if p.sid != participant_sid
-            ]
-            room.participant_count = len(room.participants)
+            removed = room._participants.pop(participant_sid, None)
+            previous_count = room.participant_count
+            room.participant_count = len(room._participants)
+
+            with self._lock:
+                self._total_participants += room.participant_count - previous_count
+                if removed is not None:
+                    self._add_quality(removed.connection_quality, -1)
+                room._json_cache = None
+                self._rooms_changed()
 
             if is_disconnect:
-                self._record_disconnect()
+                self._disconnects.record()
             else:
-                self._record_leave()
+                self._leaves.record()
 
             return True
 
-    def _record_join(self) -> None:
-        now = datetime.now(timezone.utc)
-        self._join_events.append(now)
-        self._cleanup_old_events()
+    def update_participant_quality(
+        self, room_sid: str, participant_sid: str, quality: ConnectionQuality
+    ) -> bool:
+        """Change a participant's connection quality, keeping aggregates current."""
+        shard = self._shard(room_sid)
+        with shard.lock:
+            room = shard.rooms.get(room_sid)
+            participant = room._participants.get(participant_sid) if room else None
+            if not participant:
+                return False
 
-    def _record_leave(self) -> None:
-        now = datetime.now(timezone.utc)
-        self._leave_events.append(now)
-        self._cleanup_old_events()
+            previous = participant.connection_quality
+            if previous == quality:
+                return True
+            participant.connection_quality = quality
 
-    def _record_disconnect(self) -> None:
-        now = datetime.now(timezone.utc)
-        self._disconnect_events.append(now)
-        self._cleanup_old_events()
-
-    def _cleanup_old_events(self) -> None:
-        cutoff = datetime.now(timezone.utc) - self._rate_window
-        while self._join_events and self._join_events[0] < cutoff:
-            self._join_events.popleft()
-        while self._leave_events and self._leave_events[0] < cutoff:
-            self._leave_events.popleft()
-        while self._disconnect_events and self._disconnect_events[0] < cutoff:
-            self._disconnect_events.popleft()
+            with self._lock:
+                self._add_quality(previous, -1)
+                self._add_quality(quality, 1)
+                room._json_cache = None
+                self._rooms_changed()
+            return True
 
     def _calculate_rates(self) -> tuple[float, float, float]:
         """Calculate joins/leaves/disconnects per minute."""
-        self._cleanup_old_events()
         return (
-            float(len(self._join_events)),
-            float(len(self._leave_events)),
-            float(len(self._disconnect_events)),
+            float(self._joins.count()),
+            float(self._leaves.count()),
+            float(self._disconnects.count()),
         )
 
     def compute_current_metrics(self) -> SystemMetrics:
+        now = datetime.now(timezone.utc)
         with self._lock:
-            now = datetime.now(timezone.utc)
-            rooms = list(self._rooms.values())
-
-            total_participants = sum(r.participant_count for r in rooms)
-            join_rate, leave_rate, disconnect_rate = self._calculate_rates()
-
-            # Calculate average room duration
-            room_durations = []
-            for room in rooms:
-                duration = (now - room.created_at).total_seconds()
-                room_durations.append(duration)
-            avg_duration = (
-                sum(room_durations) / len(room_durations) if room_durations else 0.0
-            )
-
-            # Calculate average connection quality
-            quality_scores = []
-            for room in rooms:
-                for participant in room.participants:
-                    if participant.connection_quality == ConnectionQuality.EXCELLENT:
-                        quality_scores.append(1.0)
-                    elif participant.connection_quality == ConnectionQuality.GOOD:
-                        quality_scores.append(0.75)
-                    elif participant.connection_quality == ConnectionQuality.POOR:
-                        quality_scores.append(0.25)
-            avg_quality = (
-                sum(quality_scores) / len(quality_scores) if quality_scores else 1.0
-            )
-
-            return SystemMetrics(
-                timestamp=now,
-                active_rooms=len(rooms),
-                total_participants=total_participants,
-                join_rate=join_rate,
-                leave_rate=leave_rate,
-                disconnect_rate=disconnect_rate,
-                avg_room_duration_seconds=avg_duration,
-                avg_connection_quality=avg_quality,
-            )
+            room_count = self._room_count
+            total_participants = self._total_participants
+            created_epoch_sum = self._created_epoch_sum
+            quality_sum = self._quality_sum
+            quality_count = self._quality_count
+
+        join_rate, leave_rate, disconnect_rate = self._calculate_rates()
+
+        # Sum of (now - created_at) over rooms is room_count * now - sum(created_at)
+        avg_duration = (
+            (room_count * now.timestamp() - created_epoch_sum) / room_count
+            if room_count else 0.0
+        )
+        avg_quality = quality_sum / quality_count if quality_count else 1.0
+
+        return SystemMetrics(
+            timestamp=now,
+            active_rooms=room_count,
+            total_participants=total_participants,
+            join_rate=join_rate,
+            leave_rate=leave_rate,
+            disconnect_rate=disconnect_rate,
+            avg_room_duration_seconds=avg_duration,
+            avg_connection_quality=avg_quality,
+        )
 
     def record_metrics_snapshot(self) -> SystemMetrics:
         """Compute and store current metrics."""
         metrics = self.compute_current_metrics()
         self._metrics_history.append(metrics)
+        with self._lock:
+            self._dirty = False
         return metrics
 
+    def metrics_changed(self, metrics: SystemMetrics) -> bool:
+        """Check whether metrics differ from the previous call, ignoring the timestamp."""
+        metrics_hash = hash((
+            metrics.active_rooms,
+            metrics.total_participants,
+            metrics.join_rate,
+            metrics.leave_rate,
+            metrics.disconnect_rate,
+            metrics.avg_room_duration_seconds,
+            metrics.avg_connection_quality,
+        ))
+        changed = metrics_hash != self._last_metrics_hash
+        self._last_metrics_hash = metrics_hash
+        return changed
+
     def get_snapshot(self) -> MetricsSnapshot:
         """Get complete metrics snapshot for API response."""
         current = self.compute_current_metrics()
@@ -215,10 +432,28 @@ class MetricsStore:
         """Get metrics history."""
         return self._metrics_history.get_all()
 
+    def get_history_json(self) -> bytes:
+        """Get metrics history as JSON, re-encoding only after a new snapshot."""
+        version = self._metrics_history.version
+        cached = self._history_json
+        if cached is None or cached[0] != version:
+            cached = (version, to_json_list(self._metrics_history.get_all()))
+            self._history_json = cached
+        return cached[1]
+
     def clear(self) -> None:
         """Clear all data (useful for testing)."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.rooms.clear()
         with self._lock:
-            self._rooms.clear()
-            self._join_events.clear()
-            self._leave_events.clear()
-            self._disconnect_events.clear()
+            self._room_count = 0
+            self._rooms_by_name.clear()
+            self._total_participants = 0
+            self._quality_sum = 0.0
+            self._quality_count = 0
+            self._created_epoch_sum = 0.0
+            self._rooms_changed()
+        self._joins.clear()
+        self._leaves.clear()
+        self._disconnects.clear()
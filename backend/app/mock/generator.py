@@ -1,14 +1,17 @@
 import asyncio
 import logging
 import random
+from bisect import bisect_left
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from ..models import Room, Participant, ConnectionQuality
+from ..models import Alert, Room, Participant, ConnectionQuality, SystemMetrics
 from ..metrics import MetricsStore
 from ..alerts import AlertEngine
 from ..websocket import WebSocketHub
+from ..serialization import to_json_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +26,31 @@ PARTICIPANT_NAMES = [
     "Quinn", "Rachel", "Sam", "Tina", "Uma", "Victor", "Wendy", "Xavier"
 ]
 
+# Participant churn actions and their cumulative weights (0.4 / 0.4 / 0.2)
+CHURN_ACTIONS = ("add", "leave", "disconnect")
+CHURN_CUM_WEIGHTS = (0.4, 0.8, 1.0)
+
+# Initial quality distribution for new participants
+INITIAL_QUALITIES = (
+    ConnectionQuality.EXCELLENT,
+    ConnectionQuality.EXCELLENT,
+    ConnectionQuality.GOOD,
+    ConnectionQuality.GOOD,
+    ConnectionQuality.GOOD,
+    ConnectionQuality.POOR,
+)
+
+# Qualities a participant may move to from its current one
+QUALITY_TRANSITIONS = {
+    ConnectionQuality.EXCELLENT: (ConnectionQuality.EXCELLENT, ConnectionQuality.GOOD),
+    ConnectionQuality.GOOD: (
+        ConnectionQuality.EXCELLENT,
+        ConnectionQuality.GOOD,
+        ConnectionQuality.POOR,
+    ),
+    ConnectionQuality.POOR: (ConnectionQuality.GOOD, ConnectionQuality.POOR),
+}
+
 
 class MockDataGenerator:
     """Generates synthetic LiveKit metrics data for demo/testing."""
@@ -38,6 +66,8 @@ class MockDataGenerator:
         self._websocket_hub = websocket_hub
         self._running = False
         self._task: Optional[asyncio.Task] = None
+        # Own RNG rather than the shared module-level one
+        self._rng = random.Random()
 
         # Configuration
         self._target_rooms = 5  # Target number of active rooms
@@ -45,6 +75,10 @@ class MockDataGenerator:
         self._room_lifetime = (60, 300)  # Room lifetime in seconds (1-5 minutes)
         self._participant_churn_rate = 0.1  # Probability of participant change per tick
         self._quality_fluctuation_rate = 0.05  # Probability of quality change
+        self._idle_threshold = 30.0  # Seconds after the last HTTP read with no WS clients
+
+        # Monotonic time of the last HTTP metrics/rooms read
+        self._last_snapshot_request = float("-inf")
 
     async def start(self) -> None:
         """Start the mock data generator."""
@@ -94,50 +128,69 @@ class MockDataGenerator:
     async def _tick(self) -> None:
         """Single tick of mock data generation."""
         rooms = self._metrics_store.get_all_rooms()
-        now = datetime.now(timezone.utc)
+        now = time.time()
 
-        # Maybe end some old rooms
-        for room in rooms:
-            room_age = (now - room.created_at).total_seconds()
-            max_lifetime = random.uniform(*self._room_lifetime)
-            if room_age > max_lifetime:
-                await self._end_room(room)
+        # Maybe end some old rooms. Each end/create broadcasts a room update,
+        # so the rooms in a phase are handled concurrently.
+        expired = [
+            room for room in rooms
+            if now - room._created_epoch > self._rng.uniform(*self._room_lifetime)
+        ]
+        await asyncio.gather(*(self._end_room(room) for room in expired))
 
         # Ensure we have enough rooms
-        current_room_count = len(self._metrics_store.get_all_rooms())
-        while current_room_count < self._target_rooms:
-            await self._create_room()
-            current_room_count += 1
+        missing = self._target_rooms - len(self._metrics_store.get_all_rooms())
+        await asyncio.gather(*(self._create_room() for _ in range(missing)))
+
+        # With nobody watching, only keep history and alerts current
+        if self._is_idle():
+            self._evaluate_metrics()
+            return
+
+        # The rest is pure CPU; run it off the event loop so broadcasts and
+        # heartbeats are not held up behind it
+        metrics, new_alerts, resolved_alerts = await asyncio.to_thread(self._cpu_tick)
+
+        # One frame per tick carries the metrics and any alert changes
+        await self._websocket_hub.broadcast_tick(metrics, new_alerts, resolved_alerts)
+
+    def touch_snapshot(self) -> None:
+        """Record that metrics were just read over HTTP."""
+        self._last_snapshot_request = time.monotonic()
 
+    def _is_idle(self) -> bool:
+        return (
+            self._websocket_hub.client_count == 0
+            and time.monotonic() - self._last_snapshot_request > self._idle_threshold
+        )
+
+    def _cpu_tick(self) -> tuple[SystemMetrics, list[Alert], list[Alert]]:
+        """Churn participants, fluctuate quality and evaluate metrics and alerts."""
         # Participant churn
         for room in self._metrics_store.get_all_rooms():
-            await self._update_room_participants(room)
+            self._update_room_participants(room)
 
         # Update connection quality
         for room in self._metrics_store.get_all_rooms():
             self._update_connection_quality(room)
 
+        return self._evaluate_metrics()
+
+    def _evaluate_metrics(self) -> tuple[SystemMetrics, list[Alert], list[Alert]]:
+        """Record a metrics snapshot and run the alert checks against it."""
         # Record metrics snapshot
         metrics = self._metrics_store.record_metrics_snapshot()
 
         # Check for alerts
         new_alerts = self._alert_engine.check_metrics(metrics)
         resolved_alerts = self._alert_engine.auto_resolve_alerts(metrics)
-
-        # Broadcast updates
-        await self._websocket_hub.broadcast_metrics(metrics.model_dump(mode="json"))
-
-        for alert in new_alerts:
-            await self._websocket_hub.broadcast_alert(alert.model_dump(mode="json"))
-
-        for alert in resolved_alerts:
-            await self._websocket_hub.broadcast_alert(alert.model_dump(mode="json"))
+        return metrics, new_alerts, resolved_alerts
 
     async def _create_room(self) -> Room:
         """Create a new mock room with participants."""
         room_id = str(uuid.uuid4())
         # Use more of the UUID to ensure uniqueness in names
-        room_name = f"{random.choice(ROOM_PREFIXES)}-{random.choice(ROOM_SUFFIXES)}-{room_id[:8]}"
+        room_name = f"{self._rng.choice(ROOM_PREFIXES)}-{self._rng.choice(ROOM_SUFFIXES)}-{room_id[:8]}"
 
         room = Room(
             sid=room_id,
@@ -150,15 +203,15 @@ class MockDataGenerator:
         self._metrics_store.add_room(room)
 
         # Add initial participants
-        num_participants = random.randint(*self._participants_per_room)
+        num_participants = self._rng.randint(*self._participants_per_room)
         for _ in range(num_participants):
-            await self._add_participant(room)
+            self._add_participant(room)
 
         logger.debug(f"Created mock room: {room_name} with {num_participants} participants")
 
         await self._websocket_hub.broadcast_room_update({
             "type": "room_started",
-            "room": room.model_dump(mode="json"),
+            "room": room,
         })
 
         return room
@@ -170,13 +223,13 @@ class MockDataGenerator:
 
         await self._websocket_hub.broadcast_room_update({
             "type": "room_finished",
-            "room": room.model_dump(mode="json"),
+            "room": room,
         })
 
-    async def _add_participant(self, room: Room) -> Participant:
+    def _add_participant(self, room: Room) -> Participant:
         """Add a participant to a room."""
         participant_id = str(uuid.uuid4())
-        name = random.choice(PARTICIPANT_NAMES)
+        name = self._rng.choice(PARTICIPANT_NAMES)
         identity = f"{name.lower()}-{participant_id[:4]}"
 
         participant = Participant(
@@ -184,83 +237,61 @@ class MockDataGenerator:
             identity=identity,
             name=name,
             joined_at=datetime.now(timezone.utc),
-            connection_quality=random.choice([
-                ConnectionQuality.EXCELLENT,
-                ConnectionQuality.EXCELLENT,
-                ConnectionQuality.GOOD,
-                ConnectionQuality.GOOD,
-                ConnectionQuality.GOOD,
-                ConnectionQuality.POOR,
-            ]),
-            is_publisher=random.random() > 0.3,
-            tracks_published=random.randint(0, 2) if random.random() > 0.3 else 0,
+            connection_quality=self._rng.choice(INITIAL_QUALITIES),
+            is_publisher=self._rng.random() > 0.3,
+            tracks_published=self._rng.randint(0, 2) if self._rng.random() > 0.3 else 0,
         )
 
         self._metrics_store.add_participant(room.sid, participant)
         return participant
 
-    async def _remove_participant(self, room: Room, is_disconnect: bool = False) -> None:
+    def _remove_participant(self, room: Room, is_disconnect: bool = False) -> None:
         """Remove a random participant from a room."""
         if not room.participants:
             return
 
-        participant = random.choice(room.participants)
+        participant = self._rng.choice(room.participants)
         self._metrics_store.remove_participant(room.sid, participant.sid, is_disconnect)
 
-    async def _update_room_participants(self, room: Room) -> None:
+    def _update_room_participants(self, room: Room) -> None:
         """Update participants in a room (churn)."""
-        if random.random() > self._participant_churn_rate:
+        if self._rng.random() > self._participant_churn_rate:
             return
 
         # Decide action: add, remove normally, or disconnect
-        action = random.choices(
-            ["add", "leave", "disconnect"],
-            weights=[0.4, 0.4, 0.2],
-            k=1,
-        )[0]
+        action = CHURN_ACTIONS[bisect_left(CHURN_CUM_WEIGHTS, self._rng.random())]
 
         min_participants, max_participants = self._participants_per_room
 
         if action == "add" and room.participant_count < max_participants:
-            await self._add_participant(room)
+            self._add_participant(room)
         elif action == "leave" and room.participant_count > min_participants:
-            await self._remove_participant(room, is_disconnect=False)
+            self._remove_participant(room, is_disconnect=False)
         elif action == "disconnect" and room.participant_count > min_participants:
-            await self._remove_participant(room, is_disconnect=True)
+            self._remove_participant(room, is_disconnect=True)
 
     def _update_connection_quality(self, room: Room) -> None:
         """Randomly fluctuate connection quality for participants."""
         for participant in room.participants:
-            if random.random() > self._quality_fluctuation_rate:
+            if self._rng.random() > self._quality_fluctuation_rate:
                 continue
 
             # Fluctuate quality
-            current_quality = participant.connection_quality
-            if current_quality == ConnectionQuality.EXCELLENT:
-                new_quality = random.choice([
-                    ConnectionQuality.EXCELLENT,
-                    ConnectionQuality.GOOD,
-                ])
-            elif current_quality == ConnectionQuality.GOOD:
-                new_quality = random.choice([
-                    ConnectionQuality.EXCELLENT,
-                    ConnectionQuality.GOOD,
-                    ConnectionQuality.POOR,
-                ])
-            else:
-                new_quality = random.choice([
-                    ConnectionQuality.GOOD,
-                    ConnectionQuality.POOR,
-                ])
-
-            participant.connection_quality = new_quality
+            transitions = QUALITY_TRANSITIONS.get(
+                participant.connection_quality, QUALITY_TRANSITIONS[ConnectionQuality.POOR]
+            )
+            new_quality = self._rng.choice(transitions)
+
+            self._metrics_store.update_participant_quality(
+                room.sid, participant.sid, new_quality
+            )
 
     def trigger_test_alert(self, severity: str = "warning") -> None:
         """Manually trigger a test alert."""
-        from ..models import AlertSeverity, AlertStatus, Alert
+        from ..models import AlertSeverity, AlertStatus
 
         alert = Alert(
-            id=str(uuid.uuid4()),
+            id=self._alert_engine.next_alert_id(),
             severity=AlertSeverity(severity),
             status=AlertStatus.ACTIVE,
             title="Test Alert",
@@ -268,7 +299,7 @@ class MockDataGenerator:
             created_at=datetime.now(timezone.utc),
         )
 
-        self._alert_engine._active_alerts[alert.id] = alert
+        self._alert_engine.add_alert(alert)
         asyncio.create_task(
-            self._websocket_hub.broadcast_alert(alert.model_dump(mode="json"))
+            self._websocket_hub.broadcast_alert(to_json_bytes(alert))
         )
@@ -1,7 +1,8 @@
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import ClassVar, Optional
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
 
 
 class ParticipantState(str, Enum):
@@ -29,7 +30,11 @@ class AlertStatus(str, Enum):
     RESOLVED = "resolved"
 
 
-class Participant(BaseModel):
+# Participant and SystemMetrics are plain dataclasses: they are built on every
+# participant event and metrics tick, where pydantic validation is pure overhead.
+# orjson encodes them natively and skips underscore-prefixed fields.
+@dataclass(kw_only=True)
+class Participant:
     sid: str
     identity: str
     name: Optional[str] = None
@@ -45,10 +50,25 @@ class Room(BaseModel):
     created_at: datetime
     participant_count: int = 0
     max_participants: int = 0
-    participants: list[Participant] = Field(default_factory=list)
 
+    # participant sid -> Participant, the canonical participant store
+    _participants: dict[str, Participant] = PrivateAttr(default_factory=dict)
+    # created_at as a Unix timestamp, for the store's duration aggregate
+    _created_epoch: float = PrivateAttr(default=0.0)
+    # Serialized JSON payload, reset to None whenever the room mutates
+    _json_cache: Optional[bytes] = None
 
-class SystemMetrics(BaseModel):
+    def model_post_init(self, __context) -> None:
+        self._created_epoch = self.created_at.timestamp()
+
+    @computed_field
+    @property
+    def participants(self) -> list[Participant]:
+        return list(self._participants.values())
+
+
+@dataclass(kw_only=True)
+class SystemMetrics:
     timestamp: datetime
     active_rooms: int = 0
     total_participants: int = 0
@@ -58,6 +78,9 @@ class SystemMetrics(BaseModel):
     avg_room_duration_seconds: float = 0.0
     avg_connection_quality: float = 0.0  # 0-1 scale
 
+    # Set per instance once encoded; a ClassVar so it is not a dataclass field
+    _json_cache: ClassVar[Optional[bytes]] = None
+
 
 class MetricsSnapshot(BaseModel):
     current: SystemMetrics
@@ -67,6 +90,7 @@ class MetricsSnapshot(BaseModel):
 
 class Alert(BaseModel):
     id: str
+    alert_type: Optional[str] = None  # Stable key used for cooldowns and auto-resolution
     severity: AlertSeverity
     status: AlertStatus = AlertStatus.ACTIVE
     title: str
@@ -75,14 +99,30 @@ class Alert(BaseModel):
     created_at: datetime
     resolved_at: Optional[datetime] = None
 
+    _json_cache: Optional[bytes] = None
+
 
 class WebSocketMessage(BaseModel):
     type: str
     data: Optional[dict] = None
 
 
+class WebhookRoom(BaseModel):
+    sid: str = ""
+    name: str = ""
+    creation_time: Optional[int] = None  # Unix timestamp
+
+
+class WebhookParticipant(BaseModel):
+    sid: str = ""
+    identity: str = ""
+    name: Optional[str] = None
+    state: str = ""
+    joined_at: Optional[int] = None  # Unix timestamp
+
+
 class WebhookEvent(BaseModel):
     event: str
-    room: Optional[dict] = None
-    participant: Optional[dict] = None
+    room: Optional[WebhookRoom] = None
+    participant: Optional[WebhookParticipant] = None
     created_at: Optional[int] = None  # Unix timestamp
@@ -0,0 +1,51 @@
+from typing import Iterable
+
+import orjson
+from pydantic import BaseModel
+
+
+def _default(obj):
+    """Fallback encoder for values orjson does not handle natively."""
+    if isinstance(obj, BaseModel):
+        return orjson.Fragment(to_json_bytes(obj))
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(data) -> bytes:
+    """Serialize plain data that may contain models to JSON."""
+    return orjson.dumps(data, default=_default, option=orjson.OPT_UTC_Z)
+
+
+def to_json_bytes(obj) -> bytes:
+    """Serialize a model or dataclass to JSON, reusing its cached payload when available.
+
+    Objects that carry a ``_json_cache`` attribute keep the encoded bytes until
+    a mutator resets the cache to ``None``.
+    """
+    cached = getattr(obj, "_json_cache", None)
+    if cached is not None:
+        return cached
+
+    if isinstance(obj, BaseModel):
+        fields = obj.__dict__
+        computed = type(obj).model_computed_fields
+        if computed:
+            fields = {**fields, **{name: getattr(obj, name) for name in computed}}
+    else:
+        # Dataclasses are encoded natively
+        fields = obj
+
+    data = orjson.dumps(fields, default=_default, option=orjson.OPT_UTC_Z)
+    if hasattr(obj, "_json_cache"):
+        obj._json_cache = data
+    return data
+
+
+def to_json_list(objs: Iterable) -> bytes:
+    """Serialize models or dataclasses to a JSON array, reusing each cached payload."""
+    return orjson.dumps([orjson.Fragment(to_json_bytes(obj)) for obj in objs])
+
+
+def wrap_message(message_type: str, data: bytes) -> bytes:
+    """Wrap a pre-serialized payload in a WebSocket message envelope."""
+    return orjson.dumps({"type": message_type, "data": orjson.Fragment(data)})
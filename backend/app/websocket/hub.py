@@ -4,10 +4,12 @@ import logging
 from datetime import datetime, timezone
 from typing import Set
 
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 from ..config import settings
-from ..models import WebSocketMessage
+from ..models import Alert, SystemMetrics, WebSocketMessage
+from ..serialization import dumps, to_json_bytes, to_json_list, wrap_message
 
 logger = logging.getLogger(__name__)
 
@@ -39,45 +41,107 @@ class WebSocketHub:
             return
 
         # Serialize message once for all clients
-        data = message.model_dump_json()
+        await self.broadcast_bytes(dumps({"type": message.type, "data": message.data}))
 
+    async def broadcast_bytes(self, data: bytes) -> None:
+        """Broadcast a pre-serialized JSON message to all connected clients."""
+        if not self._clients:
+            return
+
+        await self._send_all(data.decode())
+
+    async def _send_all(self, data: str) -> None:
+        """Send the same text frame to every connected client concurrently."""
+        # Snapshot clients so slow sends don't hold up connects/disconnects
         async with self._lock:
-            disconnected = []
-            for client in self._clients:
-                try:
-                    await client.send_text(data)
-                except Exception as e:
-                    logger.debug(f"Failed to send to client: {e}")
-                    disconnected.append(client)
+            clients = list(self._clients)
+
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(client.send_text(data), timeout=settings.ws_send_timeout)
+                for client in clients
+            ),
+            return_exceptions=True,
+        )
+
+        # Clean up clients whose send failed or timed out
+        disconnected = set()
+        for client, result in zip(clients, results):
+            if isinstance(result, Exception):
+                logger.debug(f"Failed to send to client: {result!r}")
+                disconnected.add(client)
+
+        if disconnected:
+            async with self._lock:
+                self._clients.difference_update(disconnected)
+
+            # Close dropped sockets so their clients notice and reconnect
+            # instead of sitting on a connection that no longer gets updates
+            await asyncio.gather(
+                *(
+                    asyncio.wait_for(client.close(code=1011), timeout=settings.ws_send_timeout)
+                    for client in disconnected
+                ),
+                return_exceptions=True,
+            )
+
+    async def broadcast_preencoded(self, message_type: str, payload: bytes) -> None:
+        """Broadcast an already-encoded JSON payload under the given message type.
+
+        The envelope is built around the payload bytes without re-encoding it.
+        """
+        if not self._clients:
+            return
 
-            # Clean up disconnected clients
-            for client in disconnected:
-                self._clients.discard(client)
+        await self.broadcast_bytes(wrap_message(message_type, payload))
 
     async def broadcast_dict(self, data: dict) -> None:
-        """Broadcast a dictionary as a message."""
-        message = WebSocketMessage(type=data.get("type", "update"), data=data)
-        await self.broadcast(message)
+        """Broadcast a dictionary (which may hold models) as a message."""
+        if not self._clients:
+            return
+
+        await self.broadcast_preencoded(data.get("type", "update"), dumps(data))
 
-    async def broadcast_metrics(self, metrics: dict) -> None:
+    async def broadcast_metrics(self, metrics: SystemMetrics) -> None:
         """Broadcast metrics update to all clients."""
-        message = WebSocketMessage(type="metrics_update", data=metrics)
-        await self.broadcast(message)
+        await self.broadcast_preencoded("metrics_update", to_json_bytes(metrics))
+
+    async def broadcast_tick(
+        self,
+        metrics: SystemMetrics,
+        new_alerts: list[Alert],
+        resolved_alerts: list[Alert],
+    ) -> None:
+        """Broadcast one tick's metrics and alert changes as a single message."""
+        if not self._clients:
+            return
+
+        await self.broadcast_preencoded("tick", orjson.dumps({
+            "metrics": orjson.Fragment(to_json_bytes(metrics)),
+            "new_alerts": orjson.Fragment(to_json_list(new_alerts)),
+            "resolved_alerts": orjson.Fragment(to_json_list(resolved_alerts)),
+        }))
 
     async def broadcast_room_update(self, room_data: dict) -> None:
         """Broadcast room update to all clients."""
-        message = WebSocketMessage(type="room_update", data=room_data)
-        await self.broadcast(message)
+        if not self._clients:
+            return
 
-    async def broadcast_alert(self, alert_data: dict) -> None:
-        """Broadcast alert to all clients."""
-        message = WebSocketMessage(type="alert", data=alert_data)
-        await self.broadcast(message)
+        await self.broadcast_preencoded("room_update", dumps(room_data))
+
+    async def broadcast_alert(self, alert_data: bytes) -> None:
+        """Broadcast pre-serialized alert to all clients."""
+        await self.broadcast_preencoded("alert", alert_data)
 
     async def send_heartbeat(self) -> None:
         """Send heartbeat to all clients."""
-        message = WebSocketMessage(type="heartbeat", data={"timestamp": datetime.now(timezone.utc).isoformat()})
-        await self.broadcast(message)
+        if not self._clients:
+            return
+
+        await self.broadcast_bytes(dumps({
+            "type": "heartbeat",
+            "data": {"timestamp": datetime.now(timezone.utc)},
+        }))
 
     async def start_heartbeat(self) -> None:
         """Start the heartbeat background task."""
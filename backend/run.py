@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 """Entry point for the LiveKit Operations Console backend."""
 
+import sys
+
 import uvicorn
 
+from app.config import settings
+
 
 def main():
     """Run the FastAPI application."""
@@ -10,7 +14,11 @@ def main():
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=settings.env == "development",
+        # uvloop has no Windows build
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        ws="websockets",
         log_level="info",
     )
 
@@ -0,0 +1,60 @@
+import unittest
+from datetime import datetime, timezone
+
+from app.alerts import AlertEngine, InMemoryCooldownStore
+from app.config import settings
+from app.models import SystemMetrics
+
+
+def metrics_with_participants(count: int) -> SystemMetrics:
+    return SystemMetrics(
+        timestamp=datetime.now(timezone.utc),
+        total_participants=count,
+        avg_connection_quality=1.0,
+    )
+
+
+class BreachWithinCooldownTest(unittest.TestCase):
+    """A breach that returns inside the cooldown must alert once it expires."""
+
+    def setUp(self):
+        self.clock = 1000.0
+        cooldowns = InMemoryCooldownStore(clock=lambda: self.clock)
+
+        self.engine = AlertEngine(cooldown_store=cooldowns)
+        self.high = metrics_with_participants(
+            settings.alert_high_participant_threshold + 50
+        )
+        self.low = metrics_with_participants(0)
+
+    def tick(self, metrics: SystemMetrics) -> list[str]:
+        new_alerts = self.engine.check_metrics(metrics)
+        self.engine.auto_resolve_alerts(metrics)
+        return [alert.alert_type for alert in new_alerts]
+
+    def test_auto_resolved_breach_returns_and_stays(self):
+        self.assertIn("high_participant_count", self.tick(self.high))
+        self.tick(self.low)
+        self.assertEqual(self.engine.get_active_alerts(), ())
+
+        # Back above the threshold inside the cooldown: suppressed for now
+        self.clock += 10
+        self.assertNotIn("high_participant_count", self.tick(self.high))
+
+        # Still breached after the cooldown expires: alert again
+        self.clock += self.engine._cooldown_period
+        self.assertIn("high_participant_count", self.tick(self.high))
+
+    def test_manually_resolved_breach_stays(self):
+        alert = self.engine.check_metrics(self.high)[0]
+        self.engine.resolve_alert(alert.id)
+
+        self.clock += 10
+        self.assertNotIn("high_participant_count", self.tick(self.high))
+
+        self.clock += self.engine._cooldown_period
+        self.assertIn("high_participant_count", self.tick(self.high))
+
+
+if __name__ == "__main__":
+    unittest.main()
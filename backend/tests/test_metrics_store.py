@@ -0,0 +1,159 @@
+import unittest
+from datetime import datetime, timezone
+
+from app.metrics.store import MetricsStore, RingBuffer
+from app.models import Room, SystemMetrics
+
+
+def room(sid: str, name: str) -> Room:
+    return Room(sid=sid, name=name, created_at=datetime.now(timezone.utc))
+
+
+def metrics(marker: int) -> SystemMetrics:
+    return SystemMetrics(timestamp=datetime.now(timezone.utc), active_rooms=marker)
+
+
+def filled(max_size: int, count: int) -> RingBuffer:
+    buffer = RingBuffer(max_size)
+    for marker in range(1, count + 1):
+        buffer.append(metrics(marker))
+    return buffer
+
+
+class InterleavedSlots(list):
+    """Slot list that runs ``on_read`` before the first read, once.
+
+    Stands in for a writer thread that gets scheduled while a lock-free
+    reader is between reading the counters and reading the slots.
+    """
+
+    def __init__(self, slots, on_read):
+        super().__init__(slots)
+        self.on_read = on_read
+        self.reads = 0
+
+    def __getitem__(self, key):
+        self.reads += 1
+        on_read, self.on_read = self.on_read, None
+        if on_read:
+            on_read()
+        return super().__getitem__(key)
+
+
+def markers(items: list[SystemMetrics]) -> list[int]:
+    return [item.active_rooms for item in items]
+
+
+class RoomNameIndexTest(unittest.TestCase):
+    """Rooms sharing a name must stay reachable by name until all are gone."""
+
+    def setUp(self):
+        self.store = MetricsStore()
+
+    def test_removing_newer_duplicate_keeps_older_room(self):
+        self.store.add_room(room("RM_old", "standup"))
+        self.store.add_room(room("RM_new", "standup"))
+        self.store.remove_room("RM_new")
+
+        found = self.store.get_room_by_name("standup")
+        self.assertIsNotNone(found)
+        self.assertEqual(found.sid, "RM_old")
+
+    def test_removing_last_duplicate_clears_name(self):
+        self.store.add_room(room("RM_old", "standup"))
+        self.store.add_room(room("RM_new", "standup"))
+        self.store.remove_room("RM_old")
+        self.store.remove_room("RM_new")
+
+        self.assertIsNone(self.store.get_room_by_name("standup"))
+
+    def test_readding_sid_under_new_name_moves_it(self):
+        self.store.add_room(room("RM_a", "standup"))
+        self.store.add_room(room("RM_a", "retro"))
+
+        self.assertIsNone(self.store.get_room_by_name("standup"))
+        self.assertEqual(self.store.get_room_by_name("retro").sid, "RM_a")
+
+
+class RingBufferGetAllTest(unittest.TestCase):
+    def test_empty(self):
+        self.assertEqual(RingBuffer(3).get_all(), [])
+
+    def test_partially_filled(self):
+        self.assertEqual(markers(filled(3, 2).get_all()), [1, 2])
+
+    def test_wraparound_returns_oldest_first(self):
+        self.assertEqual(markers(filled(3, 5).get_all()), [3, 4, 5])
+        self.assertEqual(markers(filled(3, 6).get_all()), [4, 5, 6])
+
+    def test_drops_slot_overwritten_while_copying(self):
+        buffer = filled(3, 5)  # slots [4, 5, 3], oldest in slot 2
+
+        def start_append():
+            # An append has claimed slot 2 and written it, but not finished
+            buffer._started += 1
+            list.__setitem__(buffer._slots, buffer._count % 3, metrics(6))
+
+        buffer._slots = InterleavedSlots(buffer._slots, start_append)
+        self.assertEqual(markers(buffer.get_all()), [4, 5])
+
+    def test_append_into_free_slot_while_copying(self):
+        buffer = filled(3, 1)
+
+        def start_append():
+            buffer._started += 1
+            list.__setitem__(buffer._slots, buffer._count % 3, metrics(2))
+
+        buffer._slots = InterleavedSlots(buffer._slots, start_append)
+        self.assertEqual(markers(buffer.get_all()), [1])
+
+
+class RingBufferGetLatestTest(unittest.TestCase):
+    def test_empty(self):
+        self.assertIsNone(RingBuffer(3).get_latest())
+
+    def test_returns_newest_after_wraparound(self):
+        self.assertEqual(filled(3, 5).get_latest().active_rooms, 5)
+
+    def test_retries_once_slot_may_have_been_reused(self):
+        buffer = filled(2, 2)
+
+        # Two appends complete after count is read: _started - count == max_size
+        def lap():
+            buffer.append(metrics(3))
+            buffer.append(metrics(4))
+
+        buffer._slots = InterleavedSlots(buffer._slots, lap)
+        self.assertEqual(buffer.get_latest().active_rooms, 4)
+        self.assertEqual(buffer._slots.reads, 2)
+
+    def test_no_retry_below_max_size(self):
+        buffer = filled(2, 2)
+
+        # One append writes the other slot: _started - count == max_size - 1
+        buffer._slots = InterleavedSlots(
+            buffer._slots, lambda: buffer.append(metrics(3))
+        )
+        self.assertEqual(buffer.get_latest().active_rooms, 2)
+        self.assertEqual(buffer._slots.reads, 1)
+
+    def test_single_slot(self):
+        buffer = filled(1, 1)
+        self.assertEqual(buffer.get_latest().active_rooms, 1)
+        buffer.append(metrics(2))
+        self.assertEqual(buffer.get_latest().active_rooms, 2)
+        self.assertEqual(markers(buffer.get_all()), [2])
+        self.assertEqual(len(buffer), 1)
+
+    def test_single_slot_retries_on_any_concurrent_append(self):
+        buffer = filled(1, 1)
+
+        buffer._slots = InterleavedSlots(
+            buffer._slots, lambda: buffer.append(metrics(2))
+        )
+        self.assertEqual(buffer.get_latest().active_rooms, 2)
+        self.assertEqual(buffer._slots.reads, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ import {
   SystemMetrics,
   Room,
   Alert,
+  TickUpdate,
   WebSocketMessage,
   ConnectionStatus,
   ChartDataPoint,
@@ -36,30 +37,60 @@ export function useMetrics(): UseMetricsReturn {
   const [resolvedAlerts, setResolvedAlerts] = useState<Alert[]>([]);
   const [chartData, setChartData] = useState<ChartDataPoint[]>([]);
 
+  const applyMetrics = useCallback((metrics: SystemMetrics) => {
+    setCurrentMetrics(metrics);
+
+    // Add to chart data
+    setChartData(prev => {
+      const newPoint: ChartDataPoint = {
+        time: new Date(metrics.timestamp).toLocaleTimeString(),
+        rooms: metrics.active_rooms,
+        participants: metrics.total_participants,
+        joinRate: metrics.join_rate,
+        disconnectRate: metrics.disconnect_rate,
+      };
+
+      // Keep last 60 data points (1 minute at 1/sec)
+      const updated = [...prev, newPoint];
+      if (updated.length > 60) {
+        return updated.slice(-60);
+      }
+      return updated;
+    });
+  }, []);
+
+  const applyAlert = useCallback((alert: Alert) => {
+    if (alert.status === 'active') {
+      setActiveAlerts(prev => {
+        // Avoid duplicates
+        const exists = prev.some(a => a.id === alert.id);
+        if (exists) return prev;
+        return [...prev, alert];
+      });
+    } else {
+      // Move from active to resolved
+      setActiveAlerts(prev => prev.filter(a => a.id !== alert.id));
+      setResolvedAlerts(prev => {
+        const exists = prev.some(a => a.id === alert.id);
+        if (exists) return prev;
+        return [alert, ...prev].slice(0, 20);  // Keep last 20
+      });
+    }
+  }, []);
+
   // Handle WebSocket messages
   const handleMessage = useCallback((message: WebSocketMessage) => {
     switch (message.type) {
       case 'metrics_update': {
-        const metrics = message.data as unknown as SystemMetrics;
-        setCurrentMetrics(metrics);
+        applyMetrics(message.data as unknown as SystemMetrics);
+        break;
+      }
 
-        // Add to chart data
-        setChartData(prev => {
-          const newPoint: ChartDataPoint = {
-            time: new Date(metrics.timestamp).toLocaleTimeString(),
-            rooms: metrics.active_rooms,
-            participants: metrics.total_participants,
-            joinRate: metrics.join_rate,
-            disconnectRate: metrics.disconnect_rate,
-          };
-
-          // Keep last 60 data points (1 minute at 1/sec)
-          const updated = [...prev, newPoint];
-          if (updated.length > 60) {
-            return updated.slice(-60);
-          }
-          return updated;
-        });
+      case 'tick': {
+        const tick = message.data as unknown as TickUpdate;
+        applyMetrics(tick.metrics);
+        tick.new_alerts.forEach(applyAlert);
+        tick.resolved_alerts.forEach(applyAlert);
         break;
       }
 
@@ -78,23 +109,7 @@ export function useMetrics(): UseMetricsReturn {
       }
 
       case 'alert': {
-        const alert = message.data as unknown as Alert;
-        if (alert.status === 'active') {
-          setActiveAlerts(prev => {
-            // Avoid duplicates
-            const exists = prev.some(a => a.id === alert.id);
-            if (exists) return prev;
-            return [...prev, alert];
-          });
-        } else {
-          // Move from active to resolved
-          setActiveAlerts(prev => prev.filter(a => a.id !== alert.id));
-          setResolvedAlerts(prev => {
-            const exists = prev.some(a => a.id === alert.id);
-            if (exists) return prev;
-            return [alert, ...prev].slice(0, 20);  // Keep last 20
-          });
-        }
+        applyAlert(message.data as unknown as Alert);
         break;
       }
 
@@ -102,7 +117,7 @@ export function useMetrics(): UseMetricsReturn {
         // Connection is alive
         break;
     }
-  }, []);
+  }, [applyMetrics, applyAlert]);
 
   // WebSocket connection
   const wsUrl = `${window.location.protocol === 'https:' ? 'wss:' : 'ws:'}//${window.location.host}/ws`;
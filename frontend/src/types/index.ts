@@ -48,6 +48,7 @@ export interface MetricsSnapshot {
 // Alert
 export interface Alert {
   id: string;
+  alert_type: string | null;
   severity: AlertSeverity;
   status: AlertStatus;
   title: string;
@@ -68,6 +69,7 @@ export type WebSocketMessageType =
   | 'metrics_update'
   | 'room_update'
   | 'alert'
+  | 'tick'
   | 'heartbeat'
   | 'pong';
 
@@ -76,6 +78,13 @@ export interface WebSocketMessage {
   data?: Record<string, unknown>;
 }
 
+// Batched per-tick update: metrics plus any alert changes
+export interface TickUpdate {
+  metrics: SystemMetrics;
+  new_alerts: Alert[];
+  resolved_alerts: Alert[];
+}
+
 // Connection status for WebSocket
 export type ConnectionStatus = 'connecting' | 'connected' | 'disconnected' | 'error';
 